@@ -16,6 +16,8 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 try:
@@ -26,6 +28,20 @@ except ModuleNotFoundError:
 from scipy.sparse import csr_matrix as sparsematrix
 
 
+@lru_cache(maxsize=128)
+def _einsum_path(subscripts, *shapes):
+    "Return the contraction path of an einsum for operands of given shapes."
+
+    operands = [np.broadcast_to(0.0, shape) for shape in shapes]
+    return np.einsum_path(subscripts, *operands, optimize="greedy")[0]
+
+
+def _optimize(subscripts, *operands):
+    "Return a cached contraction path of an einsum, re-used in later integrations."
+
+    return _einsum_path(subscripts, *[operand.shape for operand in operands])
+
+
 class IntegralFormCartesian:
     r"""Single-field integral form constructed by a function result ``fun``, a test
     field ``v``, differential volumes ``dV`` and optionally a trial field ``u``. For
@@ -111,23 +127,27 @@ class IntegralFormCartesian:
         self.u = u
         self.grad_u = grad_u
 
-        # init indices
+        # init shape
 
         # # linear form
         if not self.u:
-            self.indices = self.v.indices.ai
             self.shape = self.v.indices.shape
 
         # # bilinear form
         else:
-            cai = self.v.indices.cai
-            cbk = self.u.indices.cai
+            self.shape = (self.v.indices.shape[0], self.u.indices.shape[0])
 
-            caibk0 = np.repeat(cai, cbk.shape[1] * self.u.dim)
-            caibk1 = np.tile(cbk, (1, cai.shape[1] * self.v.dim, 1)).ravel()
+    @property
+    def indices(self):
+        "The (rows, cols)-indices of the sparse vector or matrix (not stored)."
 
-            self.indices = (caibk0, caibk1)
-            self.shape = (self.v.indices.shape[0], self.u.indices.shape[0])
+        # # linear form
+        if not self.u:
+            return self.v.indices.ai
+
+        # # bilinear form
+        else:
+            return self.v.indices.bilinear(self.u.indices)
 
     def assemble(self, values=None, parallel=False, out=None):
         "Assembly of sparse region vectors or matrices."
@@ -139,14 +159,25 @@ class IntegralFormCartesian:
             int
         )
 
+        # cached sparsity pattern in CSR format and the position of each entry
+        # # linear form
+        if not self.u:
+            indices, indptr, slot = self.v.indices.csr_vector()
+
+        # # bilinear form
+        else:
+            indices, indptr, slot = self.v.indices.csr(self.u.indices, self.shape)
+
         # broadcast values of a uniform grid mesh
-        if values.size < self.indices[0].size:
+        if values.size < slot.size:
             new_shape = (*values.shape[:-1], self.v.region.mesh.ncells)
             values = np.broadcast_to(values, new_shape)
 
-        res = sparsematrix(
-            (values.transpose(permute).ravel(), self.indices), shape=self.shape
-        )
+        values = values.transpose(permute).ravel()
+
+        # sum up the values of duplicate entries directly in the CSR data array
+        data = np.bincount(slot, weights=values, minlength=len(indices))
+        res = sparsematrix((data, indices.copy(), indptr.copy()), shape=self.shape)
 
         return res
 
@@ -186,50 +217,32 @@ class IntegralFormCartesian:
 
         if u is None:
             if not grad_v:
+                ij = "aqc,...qc,qc->a...c"
                 return einsum(
-                    "aqc,...qc,qc->a...c", vb, fun, dV, optimize=True, out=out
+                    ij, vb, fun, dV, optimize=_optimize(ij, vb, fun, dV), out=out
                 )
             else:
+                ij = "aJqc,...Jqc,qc->a...c"
                 return einsum(
-                    "aJqc,...Jqc,qc->a...c", vb, fun, dV, optimize=True, out=out
+                    ij, vb, fun, dV, optimize=_optimize(ij, vb, fun, dV), out=out
                 )
 
         else:
             if not grad_v and not grad_u:
-                res = einsum(
-                    "aqc,...qc,bqc,qc->a...bc", vb, fun, ub, dV, optimize=True, out=out
-                )
+                ij = "aqc,...qc,bqc,qc->a...bc"
+                path = _optimize(ij, vb, fun, ub, dV)
+                res = einsum(ij, vb, fun, ub, dV, optimize=path, out=out)
                 if len(res.shape) == 5:
                     return einsum("aijbc->aibjc", res, out=out)
                 else:
                     return res
             elif grad_v and not grad_u:
-                return einsum(
-                    "aJqc,iJ...qc,bqc,qc->aib...c",
-                    vb,
-                    fun,
-                    ub,
-                    dV,
-                    optimize=True,
-                    out=out,
-                )
+                ij = "aJqc,iJ...qc,bqc,qc->aib...c"
             elif not grad_v and grad_u:
-                return einsum(
-                    "a...qc,...kLqc,bLqc,qc->a...bkc",
-                    vb,
-                    fun,
-                    ub,
-                    dV,
-                    optimize=True,
-                    out=out,
-                )
+                ij = "a...qc,...kLqc,bLqc,qc->a...bkc"
             else:  # grad_v and grad_u
-                return einsum(
-                    "aJqc,iJkLqc,bLqc,qc->aibkc",
-                    vb,
-                    fun,
-                    ub,
-                    dV,
-                    optimize=True,
-                    out=out,
-                )
+                ij = "aJqc,iJkLqc,bLqc,qc->aibkc"
+
+            return einsum(
+                ij, vb, fun, ub, dV, optimize=_optimize(ij, vb, fun, ub, dV), out=out
+            )
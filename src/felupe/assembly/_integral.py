@@ -268,6 +268,10 @@ class IntegralForm:
         for val, form in zip(values, self.forms):
             res.append(form.assemble(val, parallel=parallel, out=out))
 
+        if block and self.nv == 1:
+            # a single-field form is already assembled, skip the block-conversion
+            return res[0]
+
         if block and self.mode == 2:
             K = np.zeros((self.nv, self.nv), dtype=object)
             for a, (i, j) in enumerate(zip(self.i, self.j)):
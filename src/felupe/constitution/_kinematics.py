@@ -157,20 +157,29 @@ class AreaChange:
         if parallel is None:
             parallel = self.parallel
 
-        dJdF = self.function([F])[0]
-        dFsdF = (
-            dya(dJdF, dJdF, parallel=parallel) - cdya_il(dJdF, dJdF, parallel=parallel)
-        ) / J
+        dJdF = J * transpose(inv(F, J))
+
+        if N is None:
+            dFsdF = (
+                dya(dJdF, dJdF, parallel=parallel)
+                - cdya_il(dJdF, dJdF, parallel=parallel)
+            ) / J
+
+            return [dFsdF]
 
         if parallel:
             einsum = einsumt
         else:
             einsum = np.einsum
 
-        if N is None:
-            return [dFsdF]
-        else:
-            return [einsum("ijkl...,j...->ikl...", dFsdF, N)]
+        # contract the area normal vector before the (crossed) dyadic products, i.e.
+        # (dFs_ij/dF_kl) N_j = (a_i Fs_kl - Fs_il a_k) / J with a = Fs N, instead of
+        # the evaluation (and contraction) of the full fourth-order tensor
+        dJdFN = einsum("ij...,j...->i...", dJdF, N)
+        dFsdFN = einsum("i...,kl...->ikl...", dJdFN, dJdF)
+        dFsdFN -= einsum("il...,k...->ikl...", dJdF, dJdFN)
+
+        return [np.divide(dFsdFN, J, out=dFsdFN)]
 
 
 class VolumeChange:
@@ -278,11 +278,12 @@ class NeoHooke(ConstitutiveMaterial):
             trC = ddot(F, F, parallel=self.parallel)
             trC_3 = np.divide(trC, 3, out=trC)
             np.multiply(trC_3, iFT, out=P)
-            np.add(F, -P, out=P)
+            np.subtract(F, P, out=P)
 
+            # scale the (small) array of J^(-2/3) by mu before it is applied to P
             Jm23 = np.power(J, -2 / 3, out=trC)
-            np.multiply(P, Jm23, out=P)
-            np.multiply(P, mu, out=P)
+            mu_Jm23 = np.multiply(mu, Jm23, out=Jm23)
+            np.multiply(P, mu_Jm23, out=P)
 
         if bulk is not None:
             # "physical"-volumetric (not math-volumetric!) part of P
@@ -325,7 +326,7 @@ class NeoHooke(ConstitutiveMaterial):
         if A4 is None:
             A4 = np.zeros((*F.shape[:2], *F.shape[:2], *F.shape[-2:]))
         else:
-            np.multiply(A4, 0, out=A4)
+            A4.fill(0)
 
         trC = None
         A4b = None
@@ -346,9 +347,9 @@ class NeoHooke(ConstitutiveMaterial):
             np.add(A4, np.transpose(A4c, [0, 3, 2, 1, 4, 5]), out=A4)
             np.multiply(A4c, 2 / 3, out=A4c)
             np.add(A4, A4c, out=A4)
-            np.multiply(mu, A4, out=A4)
             Jm23 = np.power(J, -2 / 3, out=trC)
-            np.multiply(Jm23, A4, out=A4)
+            mu_Jm23 = np.multiply(mu, Jm23, out=Jm23)
+            np.multiply(mu_Jm23, A4, out=A4)
 
         if bulk is not None:
             # "physical"-volumetric (not math-volumetric!) part of A4
@@ -363,7 +364,7 @@ class NeoHooke(ConstitutiveMaterial):
             qJ = np.add(pJ, bulk_J2, out=bulk_J2)
             A4c = np.multiply(qJ, A4b, out=A4c)
             np.add(A4, A4c, out=A4)
-            np.multiply(-pJ, np.transpose(A4b, [0, 3, 2, 1, 4, 5]), out=A4c)
-            np.add(A4, A4c, out=A4)
+            np.multiply(pJ, np.transpose(A4b, [0, 3, 2, 1, 4, 5]), out=A4c)
+            np.subtract(A4, A4c, out=A4)
 
         return [A4]
@@ -205,20 +205,23 @@ def morph(F, statevars, p):
         return 1 / sqrt(1 + x**2)
 
     # material parameters
-    α = p[0] + p[1] * sigmoid(p[2] * CTS)
-    β = p[3] * sigmoid(p[2] * CTS)
+    sigmoid_CTS = sigmoid(p[2] * CTS)
+    α = p[0] + p[1] * sigmoid_CTS
+    β = p[3] * sigmoid_CTS
     γ = p[4] * CTS * (1 - sigmoid(CTS / p[5]))
 
     LG = sym(dev(invC @ dC)) @ CG
     λLG = eigvalsh(LG)
     LTG = λLG[-1] - λLG[0]
+    LG_LTG = LG / LTG
 
     # limiting stresses "L" and additional stresses "A"
-    SL = (γ * expm(p[6] * LG / LTG * CTG / CTS) + p[7] * LG / LTG) @ invC
-    SA = (SAn + β * LTG * SL) / (1 + β * LTG)
+    SL = (γ * expm(p[6] * LG_LTG * CTG / CTS) + p[7] * LG_LTG) @ invC
+    β_LTG = β * LTG
+    SA = (SAn + β_LTG * SL) / (1 + β_LTG)
 
     # second Piola-Kirchhoff stress tensor
-    S = 2 * α * dev(CG) @ invC + dev(SA @ C) @ invC
+    S = (2 * α * dev(CG) + dev(SA @ C)) @ invC
     statevars_new = try_stack([[CTS], triu_1d(C), triu_1d(SA)], fallback=statevars)
 
     return S, statevars_new
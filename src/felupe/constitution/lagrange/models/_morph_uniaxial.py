@@ -53,29 +53,37 @@ def morph_uniaxial(λ, statevars, p, ε=1e-8):
     SA1n = array(statevars[42:63], like=λ, shape=(21,))
     SA2n = array(statevars[63:84], like=λ, shape=(21,))
 
-    CT = tensor_abs(λ**2 - 1 / λ)
+    # re-used powers of the stretches
+    λ2 = λ**2
+    λ3 = λ**3
+    λn2 = λn**2
+
+    CT = tensor_abs(λ2 - 1 / λ)
     CTS = maximum(CT, CTSn)
 
-    L1 = 2 * (λ**3 / λn - λn**2) / 3
-    L2 = (λn**2 / λ**3 - 1 / λn) / 3
+    L1 = 2 * (λ3 / λn - λn2) / 3
+    L2 = (λn2 / λ3 - 1 / λn) / 3
     LT = tensor_abs(L1 - L2)
 
     sigmoid = lambda x: 1 / sqrt(1 + x**2)
-    α = p[0] + p[1] * sigmoid(p[2] * CTS)
-    β = p[3] * sigmoid(p[2] * CTS)
+    sigmoid_CTS = sigmoid(p[2] * CTS)
+    α = p[0] + p[1] * sigmoid_CTS
+    β = p[3] * sigmoid_CTS
     γ = p[4] * CTS * (1 - sigmoid(CTS / p[5]))
 
-    L1_LT = L1 / (ε + LT)
-    L2_LT = L2 / (ε + LT)
+    ε_LT = ε + LT
+    L1_LT = L1 / ε_LT
+    L2_LT = L2 / ε_LT
     CT_CTS = CT / (ε + CTS)
 
-    SL1 = (γ * exp(p[6] * L1_LT * CT_CTS) + p[7] * L1_LT) / λ**2
+    SL1 = (γ * exp(p[6] * L1_LT * CT_CTS) + p[7] * L1_LT) / λ2
     SL2 = (γ * exp(p[6] * L2_LT * CT_CTS) + p[7] * L2_LT) * λ
 
-    SA1 = (SA1n + β * LT * SL1) / (1 + β * LT)
-    SA2 = (SA2n + β * LT * SL2) / (1 + β * LT)
+    β_LT = β * LT
+    SA1 = (SA1n + β_LT * SL1) / (1 + β_LT)
+    SA2 = (SA2n + β_LT * SL2) / (1 + β_LT)
 
-    dψdλ = (2 * α + SA1) * λ - (2 * α + SA2) / λ**2
+    dψdλ = (2 * α + SA1) * λ - (2 * α + SA2) / λ2
     statevars_new = try_stack([CTS, (λ - 1), SA1, SA2], fallback=statevars)
 
     return dψdλ, statevars_new
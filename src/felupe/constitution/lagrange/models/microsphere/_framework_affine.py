@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+import numpy as np
 from tensortrax.math import einsum, sqrt, trace
 from tensortrax.math.linalg import det, inv
 
@@ -5,13 +8,23 @@ from .....quadrature import BazantOh
 from ..._total_lagrange import total_lagrange
 
 
+@lru_cache
+def _structural_tensors(quadrature):
+    "Return the (weighted) structural tensors of the directions of a quadrature."
+
+    r = quadrature.points
+    M = np.einsum("ai,aj->aij", r, r)
+    Mw = np.einsum("aij,a->aij", M, quadrature.weights)
+
+    return M, Mw
+
+
 @total_lagrange
 def affine_force_statevars(F, statevars, f, kwargs, quadrature=BazantOh(n=21)):
     "Micro-sphere model: Affine force (stretch) part."
 
-    r = quadrature.points
-    M = einsum("ai,aj->aij", r, r)
-    Mw = einsum("aij,a->aij", M, quadrature.weights)
+    # structural tensors of the directions are cached for a quadrature
+    M, Mw = _structural_tensors(quadrature)
 
     # affine stretches (unimodular part)
     J = det(F)
@@ -16,7 +16,6 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from copy import deepcopy as copy
 from string import ascii_lowercase as alphabet
 
 import numpy as np
@@ -325,8 +324,9 @@ class ArbitraryOrderLagrange(Element):
         dhdr = np.zeros((n**self.dim, self.dim))
 
         # loop over columns
+        # (the 1d - basis function vectors are only replaced, not modified)
         for i in range(self.dim):
-            g = copy(h)
+            g = [*h]
             g[i] = k[i]
             dhdr[:, i] = np.einsum(self._subscripts, *g).ravel("F")
 
@@ -94,8 +94,8 @@ class FieldAxisymmetric(Field):
         # evaluated at quadrature point "q"
         # for cell "c"
         return np.einsum(
-            "ca...,aqc->...qc",
-            self.values[self.region.mesh.cells],
+            "...ac,aqc->...qc",
+            self._cell_values(),
             self.region.h,
             out=out,
         )
@@ -135,8 +135,8 @@ class FieldAxisymmetric(Field):
         # w.r.t. undeformed coordinate "J" evaluated at quadrature point "q"
         # for each cell "c"
         g = np.einsum(
-            "ca...,aJqc->...Jqc",
-            self.values[self.region.mesh.cells],
+            "...ac,aJqc->...Jqc",
+            self._cell_values(),
             self.region.dhdX,
             out=out,
         )
@@ -183,6 +183,6 @@ class FieldAxisymmetric(Field):
         g = np.pad(self._grad_2d(sym=sym, out=None), ((0, 1), (0, 1), (0, 0), (0, 0)))
 
         # set dudX_33 = u_r / R
-        g[-1, -1] = self.interpolate()[1] / self.radius
+        g[-1, -1] = self._interpolate_2d()[1] / self.radius
 
         return g
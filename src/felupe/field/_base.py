@@ -16,11 +16,10 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import numpy as np
 
-from ..math import identity
 from ..math import sym as symmetric
 from ._container import FieldContainer
 from ._indices import Indices
@@ -125,6 +124,13 @@ class Field:
 
         return cai, ai
 
+    def _cell_values(self):
+        "Return the field values at the points of all cells with a trailing cell-axis."
+
+        # the layout (..., a, c) matches the layout of the region arrays, i.e. the
+        # cells are the last (contiguous) axis for all operands of the einsum
+        return np.moveaxis(self.values, 0, -1)[..., self.region.mesh.cells.T]
+
     def grad(self, sym=False, out=None):
         r"""Gradient as partial derivative of field values w.r.t. undeformed
         coordinates, evaluated at the integration points of all cells in the region.
@@ -156,8 +162,8 @@ class Field:
         # w.r.t. undeformed coordinates "J" evaluated at quadrature point "q"
         # for each cell "c"
         g = np.einsum(
-            "ca...,aJqc->...Jqc",
-            self.values[self.region.mesh.cells],
+            "...ac,aJqc->...Jqc",
+            self._cell_values(),
             self.region.dhdX,
             out=out,
         )
@@ -193,10 +199,10 @@ class Field:
         # evaluated at quadrature point "q"
         # for cell "c"
         return np.einsum(
-            "ca...,aqc->...qc",
-            self.values[self.region.mesh.cells],
+            "...ac,aqc->...qc",
+            self._cell_values(),
             self.region.h,
-            out=None,
+            out=out,
         )
 
     def extract(self, grad=True, sym=False, add_identity=True, out=None):
@@ -238,7 +244,9 @@ class Field:
                 gr = symmetric(gr, out=gr)
 
             if add_identity:
-                gr = np.add(gr, identity(gr), out=gr)
+                # add the identity to the diagonal components only
+                for i in range(min(gr.shape[:2])):
+                    gr[i, i] += 1
 
             return gr
         else:
@@ -248,6 +256,12 @@ class Field:
         "Return a copy of the field."
         return deepcopy(self)
 
+    def _replace_values(self, values):
+        "Return a shallow copy of the field (with a shared region) with new values."
+        field = copy(self)
+        field.values = values
+        return field
+
     def fill(self, a):
         "Fill all field values with a scalar value."
         self.values.fill(a)
@@ -259,56 +273,40 @@ class Field:
 
     def __add__(self, newvalues):
         if isinstance(newvalues, np.ndarray):
-            field = deepcopy(self)
-            field.values += newvalues.reshape(-1, field.dim)
-            return field
+            return self._replace_values(self.values + newvalues.reshape(-1, self.dim))
 
         elif isinstance(newvalues, Field):
-            field = deepcopy(self)
-            field.values += newvalues.values
-            return field
+            return self._replace_values(self.values + newvalues.values)
 
         else:
             raise TypeError("Unknown type.")
 
     def __sub__(self, newvalues):
         if isinstance(newvalues, np.ndarray):
-            field = deepcopy(self)
-            field.values -= newvalues.reshape(-1, field.dim)
-            return field
+            return self._replace_values(self.values - newvalues.reshape(-1, self.dim))
 
         elif isinstance(newvalues, Field):
-            field = deepcopy(self)
-            field.values -= newvalues.values
-            return field
+            return self._replace_values(self.values - newvalues.values)
 
         else:
             raise TypeError("Unknown type.")
 
     def __mul__(self, newvalues):
         if isinstance(newvalues, np.ndarray):
-            field = deepcopy(self)
-            field.values *= newvalues.reshape(-1, field.dim)
-            return field
+            return self._replace_values(self.values * newvalues.reshape(-1, self.dim))
 
         elif isinstance(newvalues, Field):
-            field = deepcopy(self)
-            field.values *= newvalues.values
-            return field
+            return self._replace_values(self.values * newvalues.values)
 
         else:
             raise TypeError("Unknown type.")
 
     def __truediv__(self, newvalues):
         if isinstance(newvalues, np.ndarray):
-            field = deepcopy(self)
-            field.values /= newvalues.reshape(-1, field.dim)
-            return field
+            return self._replace_values(self.values / newvalues.reshape(-1, self.dim))
 
         elif isinstance(newvalues, Field):
-            field = deepcopy(self)
-            field.values /= newvalues.values
-            return field
+            return self._replace_values(self.values / newvalues.values)
 
         else:
             raise TypeError("Unknown type.")
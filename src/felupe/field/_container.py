@@ -16,7 +16,7 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import numpy as np
 
@@ -161,6 +161,13 @@ class FieldContainer:
         "Return a copy of the field."
         return deepcopy(self)
 
+    def _replace_fields(self, fields):
+        "Return a shallow copy of the field container with new fields."
+        container = copy(self)
+        container.fields = fields
+        container.evaluate = EvaluateFieldContainer(container)
+        return container
+
     def link(self, other_field):
         "Link value array of other field."
         for field, newfield in zip(self.fields, other_field.fields):
@@ -250,44 +257,36 @@ class FieldContainer:
         return ax
 
     def __add__(self, newvalues):
-        fields = deepcopy(self)
         if len(newvalues) != len(self.fields):
             newvalues = np.split(newvalues, self.offsets)
 
-        for field, dfield in zip(fields, newvalues):
-            field += dfield
-
-        return fields
+        return self._replace_fields(
+            [field + dfield for field, dfield in zip(self.fields, newvalues)]
+        )
 
     def __sub__(self, newvalues):
-        fields = deepcopy(self)
         if len(newvalues) != len(self.fields):
             newvalues = np.split(newvalues, self.offsets)
 
-        for field, dfield in zip(fields, newvalues):
-            field -= dfield
-
-        return fields
+        return self._replace_fields(
+            [field - dfield for field, dfield in zip(self.fields, newvalues)]
+        )
 
     def __mul__(self, newvalues):
-        fields = deepcopy(self)
         if len(newvalues) != len(self.fields):
             newvalues = np.split(newvalues, self.offsets)
 
-        for field, dfield in zip(fields, newvalues):
-            field *= dfield
-
-        return fields
+        return self._replace_fields(
+            [field * dfield for field, dfield in zip(self.fields, newvalues)]
+        )
 
     def __truediv__(self, newvalues):
-        fields = deepcopy(self)
         if len(newvalues) != len(self.fields):
             newvalues = np.split(newvalues, self.offsets)
 
-        for field, dfield in zip(fields, newvalues):
-            field /= dfield
-
-        return fields
+        return self._replace_fields(
+            [field / dfield for field, dfield in zip(self.fields, newvalues)]
+        )
 
     def __iadd__(self, newvalues):
         if len(newvalues) != len(self.fields):
@@ -19,6 +19,11 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 
 
+def _index_dtype(maxval):
+    "Return the smallest integer type (int32 or int64) for indices up to maxval."
+    return np.int32 if maxval <= np.iinfo(np.int32).max else np.int64
+
+
 class Indices:
     def __init__(self, cai, ai, region, dim):
         """Indices for cell "c", point "a" and component "i"."""
@@ -27,3 +32,72 @@ class Indices:
         self.ai = ai
         self.dof = np.arange(region.mesh.npoints * dim).reshape(-1, dim)
         self.shape = (region.mesh.npoints * dim, 1)
+
+        # cached sparsity patterns of bilinear forms, see ``Indices.csr()``
+        self._csr = {}
+
+        # cached sparsity pattern of linear forms, see ``Indices.csr_vector()``
+        self._csr_vector = None
+
+    def bilinear(self, other):
+        """Return the (rows, cols)-indices of a sparse matrix for a bilinear form with
+        these indices of the test field and the other indices of the trial field."""
+
+        cai = self.cai
+        cbk = other.cai
+
+        caibk0 = np.repeat(cai, cbk.shape[1] * cbk.shape[2])
+        caibk1 = np.tile(cbk, (1, cai.shape[1] * cai.shape[2], 1)).ravel()
+
+        return caibk0, caibk1
+
+    def csr(self, other, shape):
+        """Return the column indices and the index pointers of the sparse matrix in
+        compressed sparse row (CSR) format and the position in its data array for each
+        entry of a bilinear form with the other indices of the trial field. Duplicate
+        entries share the same position. The sparsity pattern is cached for the given
+        trial indices, the (rows, cols)-indices are not stored."""
+
+        key = id(other)
+
+        if key not in self._csr:
+            rows, cols = self.bilinear(other)
+
+            # sorted unique (rows, cols)-pairs and the position of each entry
+            flat = rows.astype(np.int64) * shape[1] + cols
+            del rows, cols
+
+            unique, slot = np.unique(flat, return_inverse=True)
+            rows_unique, indices = np.divmod(unique, shape[1])
+
+            # 32-bit integers are used by SciPy if possible, avoid the conversion
+            dtype = _index_dtype(max(*shape, len(unique)))
+            counts = np.bincount(rows_unique, minlength=shape[0])
+
+            indptr = np.zeros(shape[0] + 1, dtype=dtype)
+            np.cumsum(counts, dtype=dtype, out=indptr[1:])
+
+            # keep a reference to the trial indices (their id must not be re-used)
+            self._csr[key] = (other, (indices.astype(dtype), indptr, slot.ravel()))
+
+        return self._csr[key][1]
+
+    def csr_vector(self):
+        """Return the column indices and the index pointers of the sparse vector (a
+        matrix with one column) in compressed sparse row (CSR) format and the position
+        in its data array for each entry of a linear form. Duplicate entries share the
+        same position. The sparsity pattern is cached."""
+
+        if self._csr_vector is None:
+            rows_unique, slot = np.unique(self.ai[0], return_inverse=True)
+
+            dtype = _index_dtype(max(self.shape[0], len(rows_unique)))
+            counts = np.bincount(rows_unique, minlength=self.shape[0])
+
+            indices = np.zeros(len(rows_unique), dtype=dtype)
+            indptr = np.zeros(self.shape[0] + 1, dtype=dtype)
+            np.cumsum(counts, dtype=dtype, out=indptr[1:])
+
+            self._csr_vector = (indices, indptr, slot.ravel())
+
+        return self._csr_vector
@@ -73,8 +73,8 @@ class FieldPlaneStrain(Field):
         # evaluated at quadrature point "q"
         # for cell "c"
         return np.einsum(
-            "ca...,aqc->...qc",
-            self.values[self.region.mesh.cells],
+            "...ac,aqc->...qc",
+            self._cell_values(),
             self.region.h,
             out=out,
         )
@@ -114,8 +114,8 @@ class FieldPlaneStrain(Field):
         # w.r.t. undeformed coordinate "J" evaluated at quadrature point "q"
         # for each cell "c"
         g = np.einsum(
-            "ca...,aJqc->...Jqc",
-            self.values[self.region.mesh.cells],
+            "...ac,aJqc->...Jqc",
+            self._cell_values(),
             self.region.dhdX,
             out=out,
         )
@@ -340,28 +340,28 @@ def inv(A, determinant=None, full_output=False, sym=False, out=None):
         # diagonal items
         x1 = np.multiply(A[1, 2], A[2, 1], out=x1)
         x2 = np.multiply(A[1, 1], A[2, 2], out=x2)
-        np.add(-x1, x2, out=detAinvA[0, 0])
+        np.subtract(x2, x1, out=detAinvA[0, 0])
 
         x1 = np.multiply(A[0, 2], A[2, 0], out=x1)
         x2 = np.multiply(A[0, 0], A[2, 2], out=x2)
-        np.add(-x1, x2, out=detAinvA[1, 1])
+        np.subtract(x2, x1, out=detAinvA[1, 1])
 
         x1 = np.multiply(A[0, 1], A[1, 0], out=x1)
         x2 = np.multiply(A[0, 0], A[1, 1], out=x2)
-        np.add(-x1, x2, out=detAinvA[2, 2])
+        np.subtract(x2, x1, out=detAinvA[2, 2])
 
         # upper-triangle off-diagonal
         x1 = np.multiply(A[0, 1], A[2, 2], out=x1)
         x2 = np.multiply(A[0, 2], A[2, 1], out=x2)
-        np.add(-x1, x2, out=detAinvA[0, 1])
+        np.subtract(x2, x1, out=detAinvA[0, 1])
 
         x1 = np.multiply(A[0, 2], A[1, 1], out=x1)
         x2 = np.multiply(A[0, 1], A[1, 2], out=x2)
-        np.add(-x1, x2, out=detAinvA[0, 2])
+        np.subtract(x2, x1, out=detAinvA[0, 2])
 
         x1 = np.multiply(A[0, 0], A[1, 2], out=x1)
         x2 = np.multiply(A[0, 2], A[1, 0], out=x2)
-        np.add(-x1, x2, out=detAinvA[1, 2])
+        np.subtract(x2, x1, out=detAinvA[1, 2])
 
         if sym:
             detAinvA[1, 0] = detAinvA[0, 1]
@@ -371,15 +371,15 @@ def inv(A, determinant=None, full_output=False, sym=False, out=None):
             # lower-triangle off-diagonal
             x1 = np.multiply(A[1, 0], A[2, 2], out=x1)
             x2 = np.multiply(A[2, 0], A[1, 2], out=x2)
-            np.add(-x1, x2, out=detAinvA[1, 0])
+            np.subtract(x2, x1, out=detAinvA[1, 0])
 
             x1 = np.multiply(A[2, 0], A[1, 1], out=x1)
             x2 = np.multiply(A[1, 0], A[2, 1], out=x2)
-            np.add(-x1, x2, out=detAinvA[2, 0])
+            np.subtract(x2, x1, out=detAinvA[2, 0])
 
             x1 = np.multiply(A[0, 0], A[2, 1], out=x1)
             x2 = np.multiply(A[2, 0], A[0, 1], out=x2)
-            np.add(-x1, x2, out=detAinvA[2, 1])
+            np.subtract(x2, x1, out=detAinvA[2, 1])
 
     elif A.shape[:2] == (2, 2):
         detAinvA[0, 0] = A[1, 1]
@@ -401,7 +401,11 @@ def inv(A, determinant=None, full_output=False, sym=False, out=None):
         )
 
     if determinant is None:
-        detA = det(A, out=x1)
+        # expansion by the first row of the adjugate (re-uses the cofactors)
+        detA = np.multiply(detAinvA[0, 0], A[0, 0], out=x1)
+        for k in range(1, len(A)):
+            x2 = np.multiply(detAinvA[0, k], A[k, 0], out=x2)
+            np.add(detA, x2, out=detA)
     else:
         detA = determinant
 
@@ -487,22 +491,22 @@ def det(A, out=None):
 
         tmp = np.multiply(A[2, 0], A[1, 1], out=tmp)
         np.multiply(tmp, A[0, 2], out=tmp)
-        np.add(detA, -tmp, out=detA)
+        np.subtract(detA, tmp, out=detA)
 
         tmp = np.multiply(A[2, 1], A[1, 2], out=tmp)
         np.multiply(tmp, A[0, 0], out=tmp)
-        np.add(detA, -tmp, out=detA)
+        np.subtract(detA, tmp, out=detA)
 
         tmp = np.multiply(A[2, 2], A[1, 0], out=tmp)
         np.multiply(tmp, A[0, 1], out=tmp)
-        np.add(detA, -tmp, out=detA)
+        np.subtract(detA, tmp, out=detA)
 
     elif A.shape[:2] == (2, 2):
         tmp = np.multiply(A[0, 0], A[1, 1])
         np.add(detA, tmp, out=detA)
 
         tmp = np.multiply(A[1, 0], A[0, 1], out=tmp)
-        np.add(detA, -tmp, out=detA)
+        np.subtract(detA, tmp, out=detA)
 
     elif A.shape[:2] == (1, 1):
         np.add(detA, A[0, 0], out=detA)
@@ -17,6 +17,8 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 import os
 
+import numpy as np
+
 from ..math import deformation_gradient as defgrad
 from ..math import displacement as disp
 from ..tools._misc import logo, runs_on
@@ -274,7 +276,16 @@ class Job:
 
         with TimeSeriesWriter(filename) as writer:
             if filename is not None:
-                writer.write_points_cells(mesh.points, mesh.cells)
+                # write the cell connectivities with 32-bit integers (if possible)
+                dtype = None
+                if len(mesh.points) <= np.iinfo(np.int32).max:
+                    dtype = np.int32
+
+                cells = [
+                    (block.type, np.ascontiguousarray(block.data, dtype=dtype))
+                    for block in mesh.cells
+                ]
+                writer.write_points_cells(mesh.points, cells)
 
             if verbose == 1:
                 total = sum([step.nsubsteps for step in self.steps])
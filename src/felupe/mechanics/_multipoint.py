@@ -17,11 +17,24 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.sparse import eye, lil_matrix
+from scipy.sparse import csr_matrix
 
 from ._helpers import Assemble, Results
 
 
+def _penalty_matrix(t, c, multiplier, ndof):
+    """Sparse stiffness matrix of penalty springs between the degrees of freedom of
+    the points ``t`` and the related degrees of freedom of the centerpoint ``c``."""
+
+    # four entries for each (point, axis): (t, t), (t, c), (c, t), (c, c)
+    # the duplicated (c, c)-entries are summed up by the sparse matrix
+    rows = np.concatenate([t, t, c, c])
+    cols = np.concatenate([t, c, t, c])
+    data = multiplier * np.repeat([1.0, -1.0, -1.0, 1.0], len(t))
+
+    return csr_matrix((data, (rows, cols)), shape=(ndof, ndof))
+
+
 class MultiPointConstraint:
     def __init__(
         self, field, points, centerpoint, skip=(False, False, False), multiplier=1e3
@@ -35,6 +48,11 @@ class MultiPointConstraint:
         self.axes = np.arange(self.mesh.dim)[self.mask]
         self.multiplier = multiplier
 
+        # degrees of freedom of the points and the centerpoint for the active axes
+        dof = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
+        self._dof_points = dof[self.points][:, self.axes]
+        self._dof_centerpoint = dof[self.centerpoint, self.axes]
+
         self.results = Results(stress=False, elasticity=False)
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
@@ -64,11 +82,11 @@ class MultiPointConstraint:
         N = self.multiplier * (-u[self.points] + u[self.centerpoint])
         N[:, ~self.mask] = 0
 
-        r = lil_matrix(u.shape)
+        r = np.zeros(u.shape)
         r[self.points] = -N
         r[self.centerpoint] = N.sum(axis=0)
 
-        self.results.force = r.reshape(-1, 1).tocsr()
+        self.results.force = csr_matrix(r.reshape(-1, 1))
         return self.results.force
 
     def _matrix(self, field=None, parallel=False):
@@ -77,19 +95,12 @@ class MultiPointConstraint:
         if field is not None:
             self.field = field
 
-        indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
-        td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
-        cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
-
-        L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
-
-        for t, c in zip(td, cd):
-            L[t.reshape(-1, 1), t] = eye(len(t)) * self.multiplier
-            L[t.reshape(-1, 1), c] = -self.multiplier
-            L[c.reshape(-1, 1), t] = -self.multiplier
-            L[c.reshape(-1, 1), c] = eye(len(c)) * self.multiplier * len(self.points)
+        td = self._dof_points
+        cd = np.broadcast_to(self._dof_centerpoint, td.shape)
 
-        self.results.stiffness = L.tocsr()
+        self.results.stiffness = _penalty_matrix(
+            td.ravel(), cd.ravel(), self.multiplier, ndof=self.mesh.ndof
+        )
         return self.results.stiffness
 
 
@@ -106,6 +117,11 @@ class MultiPointContact:
         self.axes = np.arange(self.mesh.dim)[self.mask]
         self.multiplier = multiplier
 
+        # degrees of freedom of the points and the centerpoint for the active axes
+        dof = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
+        self._dof_points = dof[self.points][:, self.axes]
+        self._dof_centerpoint = dof[self.centerpoint, self.axes]
+
         self.results = Results(stress=False, elasticity=False)
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
@@ -158,22 +174,21 @@ class MultiPointContact:
 
         u = self.field.fields[0].values
 
-        Xc = self.mesh.points[self.centerpoint]
-        Xt = self.mesh.points[self.points]
+        Xc = self.mesh.points[self.centerpoint, self.axes]
+        Xt = self.mesh.points[self.points][:, self.axes]
 
-        xc = u[self.centerpoint] + Xc
-        xt = u[self.points] + Xt
+        xc = u[self.centerpoint, self.axes] + Xc
+        xt = u[self.points][:, self.axes] + Xt
 
-        mask = np.sign(-Xt + Xc) == np.sign(-xt + xc)
-        mask[:, ~self.mask] = True
-        n = -xt + xc
-        n[mask] = 0
+        # active contact points per (non-skipped) axis
+        active = np.sign(-Xt + Xc) != np.sign(-xt + xc)
+        n = (-xt + xc) * active
 
-        r = lil_matrix(u.shape)
-        r[self.points] = -self.multiplier * n
-        r[self.centerpoint] = self.multiplier * n.sum(axis=0)
+        rows = np.concatenate([self._dof_points[active], self._dof_centerpoint])
+        data = self.multiplier * np.concatenate([-n[active], n.sum(axis=0)])
+        cols = np.zeros_like(rows)
 
-        self.results.force = r.reshape(-1, 1).tocsr()
+        self.results.force = csr_matrix((data, (rows, cols)), shape=(u.size, 1))
         return self.results.force
 
     def _matrix(self, field=None, parallel=False):
@@ -191,19 +206,12 @@ class MultiPointContact:
         xt = u[self.points] + Xt
 
         mask = np.sign(-Xt + Xc) != np.sign(-xt + xc)
-        masks = [mask[:, ax] for ax in self.axes]
-
-        indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
-        td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
-        cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
-
-        L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
+        active = mask[:, self.axes]
 
-        for t, c, m in zip(td, cd, masks):
-            L[t[m].reshape(-1, 1), t[m]] = eye(len(t[m])) * self.multiplier
-            L[t[m].reshape(-1, 1), c] = -self.multiplier
-            L[c.reshape(-1, 1), t[m]] = -self.multiplier
-            L[c.reshape(-1, 1), c] = eye(len(c)) * self.multiplier * len(self.points[m])
+        td = self._dof_points
+        cd = np.broadcast_to(self._dof_centerpoint, td.shape)
 
-        self.results.stiffness = L.tocsr()
+        self.results.stiffness = _penalty_matrix(
+            td[active], cd[active], self.multiplier, ndof=self.mesh.ndof
+        )
         return self.results.stiffness
@@ -354,4 +354,6 @@ class SolidBody(Solid):
         else:
             J = det(F)
 
-        return dot(P, transpose(F)) / J
+        stress = dot(P, transpose(F))
+
+        return np.divide(stress, J, out=stress)
@@ -90,9 +90,9 @@ class SolidBodyGravity:
         if field is not None:
             self.field = field
 
-        # copy and take only the first (displacement) field of the container
-        f = self.field.copy()
-        f.fields = f.fields[0:1]
+        # take only the first (displacement) field of the container (shallow copy,
+        # the region with its pre-evaluated arrays is shared and not copied)
+        f = self.field._replace_fields(self.field.fields[0:1])
 
         self.results.force = self._form(
             fun=[self.results.density * self.results.gravity.reshape(-1, 1, 1)],
@@ -528,4 +528,6 @@ class SolidBodyNearlyIncompressible(Solid):
         else:
             J = det(F)
 
-        return dot(P, transpose(F)) / J
+        stress = dot(P, transpose(F))
+
+        return np.divide(stress, J, out=stress)
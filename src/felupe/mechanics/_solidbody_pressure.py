@@ -101,8 +101,8 @@ class SolidBodyPressure:
 
     def _vector(self, field=None, pressure=None, parallel=False, resize=None):
         if field is not None:
+            # the kinematics are extracted during the update of the field
             self._update(field)
-            self.results.kinematics = self._extract(self.field)
 
         fun = self._area_change.function(
             self.results.kinematics,
@@ -126,8 +126,8 @@ class SolidBodyPressure:
 
     def _matrix(self, field=None, pressure=None, parallel=False, resize=None):
         if field is not None:
+            # the kinematics are extracted during the update of the field
             self._update(field)
-            self.results.kinematics = self._extract(self.field)
 
         fun = self._area_change.gradient(
             self.results.kinematics,
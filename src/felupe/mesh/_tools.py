@@ -355,21 +355,21 @@ def revolve(points, cells, cell_type, n=11, phi=180, axis=0, expand_dim=True):
         dim_new = dim + 1
 
     p = np.pad(points, ((0, 0), (0, dim_new - dim)))
-    R = rotation_matrix
+    R = np.array([rotation_matrix(angle, dim_new, axis=axis) for angle in points_phi])
 
-    points_new = np.vstack(
-        [(R(angle, dim_new, axis=axis) @ p.T).T for angle in points_phi]
-    )
+    # rotate the points for all angles at once
+    points_new = np.einsum("kij,pj->kpi", R, p).reshape(-1, dim_new)
 
-    c = [cells + len(p) * a for a in np.arange(n)]
+    # generate new cells array
+    c = cells[np.newaxis, ...] + len(p) * np.arange(n)[..., np.newaxis, np.newaxis]
 
     if points_phi[-1] == 360:
         c[-1] = c[0]
         points_new = points_new[: len(points_new) - len(points)]
 
-    cells_new = np.vstack([np.hstack((a, b[:, sl])) for a, b in zip(c[:-1], c[1:])])
+    cells_new = np.concatenate([c[:-1], c[1:, ..., sl]], axis=-1)
 
-    return points_new, cells_new, cell_type_new
+    return points_new, cells_new.reshape(-1, cells_new.shape[-1]), cell_type_new
 
 
 @mesh_or_data
@@ -502,16 +502,8 @@ def merge_duplicate_points(points, cells, cell_type, decimals=None):
         axis=0,
     )
 
-    original = np.arange(len(points))
-
-    mask = inverse.ravel() != original
-    find = original[mask]
-    replace = inverse[mask]
-
-    cells_new = cells.copy()
-
-    for i, j in zip(find, replace):
-        cells_new[cells == i] = j
+    # the inverse of the unique points maps the old to the new point ids
+    cells_new = inverse.ravel()[cells]
 
     return points_new, cells_new, cell_type
 
@@ -771,7 +763,7 @@ def flip(points, cells, cell_type, mask=None):
     if mask is None:
         mask = slice(None)
     else:
-        mask = np.where(mask)[0].reshape(-1, 1)
+        mask = np.where(mask)[0]
 
     faces_to_flip = {
         "line": ([0, 1],),
@@ -781,10 +773,13 @@ def flip(points, cells, cell_type, mask=None):
         "hexahedron": ([0, 1, 2, 3], [4, 5, 6, 7]),
     }[cell_type]
 
-    cells_new = cells.copy()
-
+    # permutation of the points-per-cell with reversed faces
+    permutation = np.arange(cells.shape[1])
     for face in faces_to_flip:
-        cells_new[mask, face] = cells[mask, face[::-1]]
+        permutation[face] = face[::-1]
+
+    cells_new = cells.copy()
+    cells_new[mask] = cells[mask][:, permutation]
 
     return points, cells_new, cell_type
 
@@ -862,9 +857,10 @@ def mirror(
 
     centerpoint = np.array(centerpoint, dtype=float)[:dim]
 
-    points_new = points - np.einsum(
-        "i, k, ...k -> ...i", 2 * normal, normal, (points - centerpoint)
-    )
+    # householder matrix (reflection) of the mirror plane
+    reflection = np.eye(dim) - 2 * np.outer(normal, normal)
+
+    points_new = centerpoint + (points - centerpoint) @ reflection
 
     return flip(points_new, cells, cell_type, mask=None)
 
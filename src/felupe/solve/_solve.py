@@ -40,9 +40,10 @@ def partition(v, K, dof1, dof0, r=None):
     # prescribed dofs of unknowns
     u0 = u.ravel()[dof0]
 
-    # partition (stiffness) matrix
-    K11 = K[dof1, :][:, dof1]
-    K10 = K[dof1, :][:, dof0]
+    # partition (stiffness) matrix (extract the active rows only once)
+    K1 = K[dof1, :]
+    K11 = K1[:, dof1]
+    K10 = K1[:, dof0]
 
     return u, u0, K11, K10, dof1, dof0, r1
 
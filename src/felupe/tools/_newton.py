@@ -90,9 +90,9 @@ def fun_items(items, x, parallel=False):
     # link field of items with global field
     [item.field.link(x) for item in items]
 
-    # init vector with shape from global field
+    # init dense vector with shape from global field
     shape = (np.sum(x.fieldsizes), 1)
-    vector = csr_matrix(shape)
+    vector = np.zeros(shape[0])
 
     for body in items:
         # assemble vector
@@ -103,9 +103,9 @@ def fun_items(items, x, parallel=False):
             r.resize(*shape)
 
         # add vector
-        vector += r
+        vector += r.toarray()[:, 0]
 
-    return vector.toarray()[:, 0]
+    return vector
 
 
 def jac_items(items, x, parallel=False):
@@ -114,22 +114,34 @@ def jac_items(items, x, parallel=False):
     # init keyword arguments
     kwargs = {"parallel": parallel}
 
-    # init matrix with shape from global field
+    # init shape of the matrix from global field
     shape = (np.sum(x.fieldsizes), np.sum(x.fieldsizes))
-    matrix = csr_matrix(shape)
+    matrices = []
 
     for body in items:
         # assemble matrix
         K = body.assemble.matrix(**kwargs)
 
         # check and reshape matrix
-        if K.shape != matrix.shape:
+        if K.shape != shape:
             K.resize(*shape)
 
-        # add matrix
-        matrix += K
+        matrices.append(K)
 
-    return matrix
+    if len(matrices) == 0:
+        return csr_matrix(shape)
+
+    if len(matrices) == 1:
+        # return a copy, the matrix must not share the stiffness matrix of the item
+        return matrices[0].tocsr(copy=True)
+
+    # sum up the matrices in CSR format (a linear merge of the sorted rows)
+    K = matrices[0].tocsr()
+
+    for other in matrices[1:]:
+        K = K + other.tocsr()
+
+    return K
 
 
 def fun(x, umat, parallel=False, grad=True, add_identity=True, sym=False):
@@ -186,8 +198,7 @@ def check(dx, x, f, xtol, ftol, dof1=None, dof0=None, items=None, eps=1e-3):
     success = fnorm < ftol and xnorm < xtol
 
     if success and items is not None:
-        for item in items:
-            [item.results.update_statevars() for item in items]
+        [item.results.update_statevars() for item in items]
 
     return xnorm, fnorm, success
 
@@ -21,6 +21,24 @@ import numpy as np
 from ..math import displacement, eigvalsh, equivalent_von_mises, tovoigt
 
 
+def _project_stacked(project, values, region):
+    "Project a list of arrays at quadrature-points all at once to mesh-points."
+
+    shapes = [v.shape[:-2] for v in values]
+    sizes = [int(np.prod(shape)) for shape in shapes]
+
+    # stack the tensor-components of all arrays and project them with one call
+    stacked = np.concatenate(
+        [v.reshape(size, *v.shape[-2:]) for v, size in zip(values, sizes)]
+    )
+    projected = project(stacked, region)
+
+    # split the projected values and restore the shapes of the tensors
+    projected = np.split(projected, np.cumsum(sizes)[:-1], axis=1)
+
+    return [p.reshape(-1, *shape) for p, shape in zip(projected, shapes)]
+
+
 class Scene:
     """Base class for plotting a static scene.
 
@@ -439,17 +457,19 @@ class ViewField(ViewMesh):
                 .T,
             }
         elif callable(project):
-            point_data_from_field = {
-                "Deformation Gradient": project(
-                    field.evaluate.deformation_gradient(), field.region
-                ),
-                "Logarithmic Strain": project(
-                    field.evaluate.strain(tensor=True, asvoigt=True), field.region
-                ),
-                "Principal Values of Logarithmic Strain": project(
-                    field.evaluate.strain(tensor=False), field.region
-                ),
-            }
+            labels = [
+                "Deformation Gradient",
+                "Logarithmic Strain",
+                "Principal Values of Logarithmic Strain",
+            ]
+            values = [
+                field.evaluate.deformation_gradient(),
+                field.evaluate.strain(tensor=True, asvoigt=True),
+                field.evaluate.strain(tensor=False),
+            ]
+            point_data_from_field = dict(
+                zip(labels, _project_stacked(project, values, field.region))
+            )
         else:
             raise TypeError("The project-argument must be callable or None.")
 
@@ -546,14 +566,18 @@ class ViewSolid(ViewField):
                 )
 
             elif callable(project):
-                point_data_from_solid[stress_label] = project(
-                    tovoigt(stress), solid.field.region
-                )
-                point_data_from_solid[f"Principal Values of {stress_label}"] = project(
-                    eigvalsh(stress), solid.field.region
-                )
-                point_data_from_solid[f"Equivalent of {stress_label}"] = project(
-                    equivalent_von_mises(stress), solid.field.region
+                labels = [
+                    stress_label,
+                    f"Principal Values of {stress_label}",
+                    f"Equivalent of {stress_label}",
+                ]
+                values = [
+                    tovoigt(stress),
+                    eigvalsh(stress),
+                    equivalent_von_mises(stress),
+                ]
+                point_data_from_solid = dict(
+                    zip(labels, _project_stacked(project, values, solid.field.region))
                 )
             else:
                 raise TypeError("The project-argument must be callable or None.")
@@ -17,7 +17,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 from scipy.sparse import issparse
 
 from ..math import cross
@@ -29,7 +29,7 @@ def force(field, forces, boundary):
     if issparse(forces):
         forces = forces.toarray()
 
-    forces_first_field = np.split(forces, field.offsets)[0]
+    forces_first_field = forces[: field.fieldsizes[0]]
     dim = field[0].dim
 
     return ((forces_first_field.reshape(-1, dim))[boundary.points]).sum(axis=0)
@@ -45,7 +45,7 @@ def moment(field, forces, boundary, centerpoint=np.zeros(3)):
     centerpoint = np.asarray(centerpoint).reshape(1, -1)[:, :dim]
 
     displacements = field[0].values
-    force = (np.split(forces, field.offsets)[0]).reshape(-1, dim)
+    force = forces[: field.fieldsizes[0]].reshape(-1, dim)
 
     moments = cross(
         (field.region.mesh.points + displacements - centerpoint)[boundary.points].T,
@@ -58,11 +58,16 @@ def moment(field, forces, boundary, centerpoint=np.zeros(3)):
 def curve(x, y, num=50):
     "Interpolate a curve from given (x, y) data."
 
-    kind = [None, "linear", "quadratic", "cubic"][min(len(y), 4) - 1]
+    # spline degree: linear, quadratic or cubic (depending on the number of points)
+    k = min(len(y) - 1, 3)
 
-    f = interp1d(x[: len(y)], y, kind=kind)
+    xt = np.asarray(x[: len(y)])
+
+    # the spline requires increasing x-values, e.g. decreasing displacements of a
+    # compression load case are sorted (the direction of the curve is kept)
+    order = np.argsort(xt)
+    spline = make_interp_spline(xt[order], np.asarray(y)[order], k=k)
 
-    xt = x[: len(y)]
     xx = np.linspace(xt[0], xt[-1], num=num)
 
-    return np.array([xt, y]), np.array([xx, f(xx)])
+    return np.array([xt, y]), np.array([xx, spline(xx)])
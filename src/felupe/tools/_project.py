@@ -17,7 +17,6 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.sparse import csr_matrix as sparsematrix
 from scipy.sparse.linalg import spsolve
 
 from ..assembly import IntegralFormCartesian
@@ -35,6 +34,18 @@ from ..quadrature import Triangle as TriangleQuadrature
 from ..region import Region
 
 
+def _scatter_sum(rows, values, n):
+    "Sum up the values of duplicated rows (grouped sum) of length n."
+
+    return np.bincount(rows, weights=values, minlength=n)
+
+
+def _point_component_indices(cells, size):
+    "Indices for (cell, point-per-cell, component) of a flattened points-array."
+
+    return (size * cells.reshape(*cells.shape, 1) + np.arange(size)).ravel()
+
+
 def topoints(values, region, average=True, mean=False):
     """Shift array of values located at quadrature points of cells to mesh-points.
 
@@ -83,29 +94,18 @@ def topoints(values, region, average=True, mean=False):
         values = values[..., :points_per_cell, :]
 
     if average:
-        # trailing axes (of broadcasted and trimmed values)
-        axes = values.shape[-2:]
+        # values of all tensor-components as (cell, point-per-cell, component)
+        values = values.reshape(size, *values.shape[-2:]).T.ravel()
+        rows = _point_component_indices(region.mesh.cells, size)
 
-        # create a field to output the values at mesh-points
-        field = Field(region, dim=size)
-
-        # field-values as column vector for result of sparse-matrix
-        field.values = field.values.reshape(-1, 1)
-        field.values = sparsematrix(
-            (values.reshape(-1, *axes).T.ravel(), field.indices.ai),
-            shape=field.indices.shape,
-        ).toarray(out=field.values)
-
-        # reshape field-values to original shape
-        field.values = field.values.reshape(-1, *shape)
+        # sum up the values of all components at once at the mesh-points
+        out = _scatter_sum(rows, values, n=size * region.mesh.npoints)
+        out = out.reshape(-1, size)
 
         # divide the result by the number of cells per mesh-point
-        out = np.einsum(
-            "a...,a->a...",
-            field.values,
-            1 / region.mesh.cells_per_point,
-            out=field.values,
-        )
+        out /= region.mesh.cells_per_point.reshape(-1, 1)
+        out = out.reshape(-1, *shape)
+
     else:
         out = np.einsum("...qc->cq...", values)
         out = out.reshape(-1, *shape)
@@ -187,14 +187,10 @@ def extrapolate(values, region, average=True, mean=False):
         v = np.broadcast_to(v, shape=shape)
 
     if average:
-        # create dummy field for values on original mesh
-        # (used for calculation of sparse-matrix indices)
-        g = Field(region, dim=size)
-
         # average values
-        w = sparsematrix(
-            (v.T.ravel(), g.indices.ai), shape=(size * region.mesh.npoints, 1)
-        ).toarray().reshape(-1, size) / region.mesh.cells_per_point.reshape(-1, 1)
+        rows = _point_component_indices(region.mesh.cells, size)
+        w = _scatter_sum(rows, v.T.ravel(), n=size * region.mesh.npoints)
+        w = w.reshape(-1, size) / region.mesh.cells_per_point.reshape(-1, 1)
 
     else:
         w = v.T
@@ -73,15 +73,13 @@ def save(
     u = field.fields[0]
     mesh = region.mesh
 
-    offsets = field.offsets
-
     if point_data is None:
         point_data = {}
 
     point_data["Displacements"] = u.values
 
     if forces is not None:
-        reactionforces = np.split(forces, offsets)[0]
+        reactionforces = forces[: field.fieldsizes[0]]
         point_data["Reaction Force"] = reactionforces.reshape(*u.values.shape)
 
     if gradient is not None:
@@ -90,12 +88,18 @@ def save(
         P = gradient[0]
 
         # cauchy stress at integration points
-        s = dot(P, transpose(F)) / det(F)
+        s = dot(P, transpose(F))
+        s = np.divide(s, det(F), out=s)
         sp = eigvalsh(s)
 
         # shift stresses to points and average nodal values
-        cauchy = topoints(s, region=region)
-        cauchyprinc = topoints(sp, region=region)
+        # (all components of the tensor and the principal values at once)
+        dim = s.shape[0]
+        values = np.concatenate([s.reshape(dim**2, *s.shape[-2:]), sp])
+        values_points = topoints(values, region=region)
+
+        cauchy = values_points[:, : dim**2].reshape(-1, dim, dim)
+        cauchyprinc = values_points[:, dim**2 :]
 
         point_data["Cauchy Stress"] = cauchy
 
@@ -27,6 +27,7 @@ along with Felupe.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
 import pytest
+from scipy.sparse import coo_matrix
 
 import felupe as fem
 
@@ -125,6 +126,18 @@ def pre_axi_mixed():
     return r, f, W.gradient(f.extract())[:-1], W.hessian(f.extract())
 
 
+def compare_coo(form, values):
+    "Compare the assembly by the cached CSR pattern with a COO-assembly."
+
+    res = form.assemble(values)
+    res0 = coo_matrix(
+        (np.moveaxis(values, -1, 0).ravel(), form.indices), shape=form.shape
+    ).tocsr()
+
+    assert np.allclose(res.toarray(), res0.toarray())
+    assert res.nnz == res0.nnz
+
+
 def test_axi():
     r, u, P, A = pre_axi()
 
@@ -166,6 +179,9 @@ def test_linearform():
         b = L.assemble(parallel=parallel).toarray()
         assert b.shape == (r.mesh.npoints, 1)
 
+    L = fem.IntegralForm([P], u, r.dV, grad_v=[True])
+    compare_coo(L.forms[0], L.integrate()[0])
+
 
 def test_linearform_broadcast():
     r, u, p, P, A = pre_broadcast()
@@ -204,6 +220,13 @@ def test_bilinearform():
         K = a.assemble(parallel=parallel).toarray()
         assert K.shape == (r.mesh.ndof, r.mesh.npoints)
 
+    a = fem.IntegralForm(A, u, r.dV, u)
+    compare_coo(a.forms[0], a.integrate()[0])
+
+    # the cached indices of small forms are stored as 32-bit integers
+    indices, indptr, slot = u[0].indices.csr(u[0].indices, a.forms[0].shape)
+    assert indices.dtype == indptr.dtype == np.int32
+
 
 def test_bilinearform_broadcast():
     r, u, p, P, A = pre_broadcast()
@@ -65,8 +65,8 @@ def test_pressure():
     h = fem.RegionHexahedron(m)
     u = fem.Field(h, dim=3)
 
-    np.random.seed(156)
-    u.values = np.random.rand(*u.values.shape) / 10
+    rng = np.random.default_rng(156)
+    u.values = rng.random(u.values.shape) / 10
     v = fem.FieldContainer([u])
 
     s = fem.RegionHexahedronBoundary(m)
@@ -107,9 +107,9 @@ def test_pressure():
     c._update(v, q)
     assert np.allclose(v[0].values, q[0].values)
 
-    np.random.seed(156)
+    rng = np.random.default_rng(156)
     w = fem.FieldsMixed(h)
-    w[0].values = np.random.rand(*w[0].values.shape) / 10
+    w[0].values = rng.random(w[0].values.shape) / 10
 
     c._update(w, v)
     assert np.allclose(w[0].values, v[0].values)
@@ -122,8 +122,8 @@ def pre(dim, bulk=2):
     r = fem.RegionHexahedron(m)
     u = fem.Field(r, dim=dim)
 
-    np.random.seed(156)
-    u.values = np.random.rand(*u.values.shape) / 10
+    rng = np.random.default_rng(156)
+    u.values = rng.random(u.values.shape) / 10
 
     return umat, fem.FieldContainer([u])
 
@@ -135,8 +135,8 @@ def pre_axi(bulk=2):
     r = fem.RegionQuad(m)
     u = fem.FieldAxisymmetric(r)
 
-    np.random.seed(156)
-    u.values = np.random.rand(*u.values.shape) / 10
+    rng = np.random.default_rng(156)
+    u.values = rng.random(u.values.shape) / 10
 
     return umat, fem.FieldContainer([u])
 
@@ -148,8 +148,8 @@ def pre_planestrain(bulk=2):
     r = fem.RegionQuad(m)
     u = fem.FieldPlaneStrain(r)
 
-    np.random.seed(156)
-    u.values = np.random.rand(*u.values.shape) / 10
+    rng = np.random.default_rng(156)
+    u.values = rng.random(u.values.shape) / 10
 
     return umat, fem.FieldContainer([u])
 
@@ -161,10 +161,10 @@ def pre_mixed(dim):
     r = fem.RegionHexahedron(m)
     u = fem.FieldsMixed(r, n=3)
 
-    np.random.seed(156)
-    u[0].values = np.random.rand(*u[0].values.shape) / 10
-    u[1].values = np.random.rand(*u[1].values.shape) / 10
-    u[2].values = np.random.rand(*u[2].values.shape) / 10
+    rng = np.random.default_rng(156)
+    u[0].values = rng.random(u[0].values.shape) / 10
+    u[1].values = rng.random(u[1].values.shape) / 10
+    u[2].values = rng.random(u[2].values.shape) / 10
 
     return umat, u
 
@@ -216,6 +216,22 @@ def test_solidbody():
         t2 = b.evaluate.kirchhoff_stress(u)
         assert np.allclose(t1, t2)
 
+    # the stress is updated after an in-place change of the material
+    umat = fem.NeoHooke(mu=1, bulk=5)
+    b = fem.SolidBody(umat=umat, field=u)
+    s1 = b.evaluate.cauchy_stress(u)
+    umat.mu = 2
+    umat.kwargs["mu"] = 2
+    s2 = b.evaluate.cauchy_stress(u)
+    assert not np.allclose(s1, s2)
+
+    # the stiffness matrix is updated after an in-place change of the material
+    K1 = b.assemble.matrix(u).toarray()
+    umat.mu = 3
+    umat.kwargs["mu"] = 3
+    K2 = b.assemble.matrix(u).toarray()
+    assert not np.allclose(K1, K2)
+
 
 def test_solidbody_incompressible():
     umat, u = pre(dim=3, bulk=None)
@@ -103,6 +103,11 @@ def test_meshes():
     fem.mesh.revolve(m.points, m.cells, m.cell_type, n=11, phi=180, axis=0)
     fem.mesh.revolve(m.points, m.cells, m.cell_type, n=11, phi=360, axis=0)
 
+    mr360 = fem.mesh.revolve(m, n=11, phi=360, axis=0)
+    assert mr360.npoints == 10 * m.npoints
+    assert mr360.ncells == 10 * m.ncells
+    assert mr360.cells.max() < mr360.npoints
+
     mr2 = fem.mesh.revolve(m, phi=np.linspace(0, 180, 11), axis=0)
 
     assert np.allclose(mr1.points, mr2.points)
@@ -178,6 +183,14 @@ def test_meshes():
     fem.mesh.merge_duplicate_cells(m)
     m.merge_duplicate_cells()
 
+    rect1 = fem.Rectangle(n=11)
+    rect2 = fem.Rectangle(a=(0.9, 0), b=(1.9, 1), n=11)
+    joined = fem.mesh.concatenate([rect1, rect2])
+    merged = joined.merge_duplicate_points(decimals=6)
+    assert joined.npoints == 242
+    assert merged.npoints == 220
+    assert np.allclose(merged.points[merged.cells], joined.points[joined.cells])
+
     m.as_meshio(point_data={"data": m.points}, cell_data={"cell_data": [m.cells[:, 0]]})
     m.save()
 
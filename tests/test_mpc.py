@@ -237,6 +237,28 @@ def test_mpc_isolated():
     )
 
 
+def test_mpc_matrix():
+    mesh = fem.Cube(n=2)
+    mesh.points = np.vstack((mesh.points, [2, 0, 0]))
+    mesh.update(cells=mesh.cells)
+
+    region = fem.RegionHexahedron(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+
+    points = [1, 3]
+    mpc = fem.MultiPointConstraint(field, points=points, centerpoint=8, multiplier=1e3)
+    K = mpc.assemble.matrix().toarray()
+
+    dof = np.arange(mesh.ndof).reshape(mesh.points.shape)
+    t, c = dof[points], dof[8]
+
+    assert np.allclose(K[t, t], 1e3)
+    assert np.allclose(K[t, c], -1e3)
+    assert np.allclose(K[c, t], -1e3)
+    assert np.allclose(K[c, c], 2e3)
+    assert np.count_nonzero(K) == 3 * (3 * len(points) + 1)
+
+
 def test_mpc_plot_2d():
     mesh = fem.Rectangle(n=3)
     field = fem.FieldContainer([fem.FieldPlaneStrain(fem.RegionQuad(mesh), dim=2)])
@@ -260,4 +282,5 @@ if __name__ == "__main__":
     test_mpc()
     test_mpc_mixed()
     test_mpc_isolated()
+    test_mpc_matrix()
     test_mpc_plot_2d()
@@ -490,6 +490,17 @@ def test_extrapolate():
         projected = fem.tools.extrapolate(values, region, average=True)
 
 
+def test_curve():
+    x = np.array([0, -0.1, -0.2, -0.3, -0.4])
+    y = 2 * x
+
+    xy, xxyy = fem.tools.curve(x, y, num=11)
+
+    assert np.allclose(xy, [x, y])
+    assert np.allclose(xxyy[0], np.linspace(0, -0.4, num=11))
+    assert np.allclose(xxyy[1], 2 * xxyy[0])
+
+
 if __name__ == "__main__":
     test_solve()
     test_solve_mixed()
@@ -502,3 +513,4 @@ if __name__ == "__main__":
     test_project()
     test_topoints()
     test_extrapolate()
+    test_curve()